@@ -9,15 +9,89 @@ Supports PDF (LaTeX), WebPDF, HTML, and Mercury dashboard generation.
 import os
 import sys
 import argparse
-import tempfile
+import asyncio
+import atexit
+import functools
+import json
+import logging
+import multiprocessing
 import re
+import string
+import subprocess
+import threading
 import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 
+import base64
+from io import BytesIO
+
+import html
+import mistune
 import nbconvert
-from nbconvert import WebPDFExporter, PDFExporter, HTMLExporter
+import nbformat.reader
+from nbconvert import PDFExporter, HTMLExporter
+from nbconvert.filters import ansi2html, clean_html
 from traitlets.config import Config
 
+# Optional faster JSON parser for (often multi-MB) notebook files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional incremental JSON parser, used to keep peak memory down on very large notebooks
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional static image export for Plotly charts (pre-rendered to SVG instead of drawn in the browser)
+try:
+    import kaleido  # noqa: F401 - plotly.io uses it for to_image()
+    import plotly.io as pio
+except ImportError:
+    pio = None
+
+# Optional minifiers for the CSS/JS injected into every page
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+# Optional image library for downscaling oversized embedded images
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Optional browser-free PDF engine (PlutoBook's Python binding); used for static pages
+try:
+    import plutoprint
+    _HAS_PLUTOPRINT = True
+except ImportError:
+    _HAS_PLUTOPRINT = False
+
+logger = logging.getLogger(__name__)
+
+# nbconvert noise that doesn't apply here: Plotly outputs are rendered by our own
+# script, and the Python 3 lexer is fine for IPython cells
+warnings.filterwarnings(
+    "ignore",
+    message=r"Your element with mimetype\(s\) dict_keys\(\['application/vnd\.plotly\.v1\+json'\]\) is not able to be represented\.",
+    category=UserWarning,
+)
+warnings.filterwarnings(
+    "ignore",
+    message=r"IPython3 lexer unavailable, falling back on Python 3",
+    category=UserWarning,
+)
+
 # Standard page sizes (width × height in mm)
 PAGE_SIZES = {
     'a0': (841, 1189), 
@@ -33,599 +107,1342 @@ PAGE_SIZES = {
     'case_study': (420, 1189)
 }
 
-def create_custom_html_template(page_size, orientation, margins):
-    """Create custom HTML template with proper @page CSS rules."""
-    
-    # Get dimensions
-    if page_size.lower() in PAGE_SIZES:
-        width, height = PAGE_SIZES[page_size.lower()]
-        css_size = page_size.upper()
-    else:
-        width, height = PAGE_SIZES['a4']
-        css_size = 'A4'
-    
-    # Swap for landscape
-    if orientation.lower() == 'landscape':
-        width, height = height, width
-        css_orientation = 'landscape'
-    else:
-        css_orientation = 'portrait'
-    
-    # Create the HTML template with embedded CSS
-    html_template = f'''
-{{% extends "lab/index.html.j2" %}}
+# Chromium switches for headless printing: skip subsystems a PDF render never uses
+_CHROMIUM_ARGS = [
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-dev-shm-usage',
+    '--disable-audio-output',
+    '--disable-background-networking',
+    '--disable-renderer-backgrounding',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--no-first-run',
+    '--disable-pdf-tagging',
+]
+
+# Remote resource types not worth waiting for when printing (fonts fall back to the local stack).
+# Pages with math keep their fonts: MathJax's CHTML output needs its web fonts from the CDN.
+_BLOCKED_RESOURCE_TYPES = frozenset({'font', 'media', 'websocket', 'eventsource', 'manifest'})
+_BLOCKED_RESOURCE_TYPES_MATH = _BLOCKED_RESOURCE_TYPES - {'font'}
+
+# Pages printed at once in the shared browser; more mostly adds memory pressure
+_MAX_CONCURRENT_PAGES = 4
+
+# Only remote requests are routed; local file:// assets load untouched
+_REMOTE_URL_RE = re.compile(r"^https?://")
+
+# LaTeX delimiters that Markdown cells render as math: \( \[ $$ \begin{ and inline $...$
+_MATH_RE = re.compile(r"\\\(|\\\[|\$\$|\\begin\{|\$[^$\n]+\$")
+
+# CSS pixels per millimetre (96 px per inch)
+_PX_PER_MM = 96 / 25.4
+
+# Embedded images are downscaled to at most this resolution across the page's content width,
+# but only when they are at least _IMAGE_MIN_FACTOR times too wide and _IMAGE_MIN_BYTES large;
+# below that the resample costs more time than the smaller PDF saves
+_IMAGE_DPI = 300
+_IMAGE_MIN_FACTOR = 2
+_IMAGE_MIN_BYTES = 256 * 1024
+
+# Bytes requested per IO.read when streaming a PDF out of Chromium
+_PDF_STREAM_CHUNK = 1024 * 1024
 
-{{% block html_head_css %}}
-{{{{ super() }}}}
+# Plotly's output MIME type and whether Kaleido has already failed in this process
+_PLOTLY_MIME = 'application/vnd.plotly.v1+json'
+_KALEIDO_BROKEN = False
+
+# Most Kaleido exports (each with its own browser) run at once for a single notebook
+_KALEIDO_MAX_WORKERS = 4
+
+# Notebooks larger than this are parsed incrementally when ijson is installed
+_STREAM_PARSE_BYTES = 10_000_000
+
+# Points per unit for the CSS lengths accepted by --margins
+_PT_PER_UNIT = {'pt': 1.0, 'pc': 12.0, 'in': 72.0, 'cm': 72 / 2.54, 'mm': 72 / 25.4, 'px': 0.75}
+
+# Lower-cased lookup table so size names only need normalizing once per call
+_NORMALIZED_SIZES = {name.lower(): dims for name, dims in PAGE_SIZES.items()}
+
+# Custom nbconvert template with embedded CSS, compiled once; $width/$height are in mm
+_CUSTOM_TEMPLATE = string.Template('''
+{% extends "lab/index.html.j2" %}
+
+{% block html_head_css %}
+{{ super() }}
 <style>
-/* Page size control */
-@page {{
-    size: {css_size} {css_orientation};
-    margin: {margins};
-}}
-
-/* Alternative approach with explicit dimensions */
-@page {{
-    size: {width}mm {height}mm;
-    margin: {margins};
-}}
+/* Page size control: a single rule with explicit dimensions (orientation already applied) */
+@page {
+    size: ${width}mm ${height}mm;
+    margin: $margins;
+}
 
 /* Print-specific styles */
-@media print {{
-    body {{
+@media print {
+    body {
         margin: 0;
-        padding: {margins};
-        width: {width}mm;
-        height: {height}mm;
+        padding: $margins;
         box-sizing: border-box;
-    }}
+    }
     
-    .jp-Notebook {{
+    .jp-Notebook {
         width: 100%;
         max-width: none;
         margin: 0;
         padding: 0;
-    }}
+    }
     
-    .jp-Cell {{
-        page-break-inside: avoid;
+    .jp-Cell {
         margin-bottom: 10pt;
-    }}
+    }
+    
+    /* Only keep code inputs whole; avoiding breaks in every cell forces extra layout passes */
+    .jp-CodeCell .jp-Cell-inputWrapper {
+        break-inside: avoid;
+    }
     
-    .jp-OutputArea-output {{
+    .jp-OutputArea-output {
         page-break-inside: avoid;
-    }}
-}}
+    }
+}
 
 /* General styling */
-body {{
+body {
     font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
     font-size: 11pt;
     line-height: 1.4;
     color: #333;
-}}
+}
 
-.jp-Notebook {{
+.jp-Notebook {
     background: white;
     padding: 0;
-}}
+}
 
-.jp-Cell {{
+.jp-Cell {
     margin-bottom: 1em;
-}}
+}
 
 /* Code styling */
-.jp-CodeCell .jp-Cell-inputWrapper {{
+.jp-CodeCell .jp-Cell-inputWrapper {
     background: #f8f9fa;
     border-left: 4px solid #007acc;
     padding: 8pt;
     margin: 8pt 0;
-}}
+}
 
-.jp-OutputArea {{
+.jp-OutputArea {
     background: white;
     border-left: 4px solid #28a745;
     padding: 8pt;
     margin: 8pt 0;
-}}
+}
 
 /* Table styling */
-table {{
+table {
     border-collapse: collapse;
     width: 100%;
     margin: 8pt 0;
-}}
+}
 
-th, td {{
+th, td {
     border: 1px solid #ddd;
     padding: 6pt;
     text-align: left;
-}}
+}
 
-th {{
+th {
     background-color: #f2f2f2;
     font-weight: bold;
-}}
+}
+
+/* Fixed table layout so Chromium doesn't measure every cell of large DataFrames;
+   long values wrap inside their column instead of spilling into the next one */
+table, .jp-RenderedHTMLCommon table, .dataframe {
+    table-layout: fixed;
+}
+th, td {
+    overflow-wrap: anywhere;
+}
+
+/* Let Chromium lay out each output as an isolated subtree */
+.jp-OutputArea-output {
+    contain: layout style;
+}
 
 /* Image sizing */
-img {{
+img {
     max-width: 100%;
     height: auto;
-}}
+}
 
 /* Matplotlib figure sizing */
-.jp-OutputArea-output img {{
+.jp-OutputArea-output img {
     max-width: 100%;
     height: auto;
-}}
+}
 </style>
-{{% endblock html_head_css %}}
-'''
-    
-    return html_template
+{% endblock html_head_css %}
+''')
 
-def convert_with_working_pagesize(notebook_file, page_size='a4', orientation='portrait',
-                                 margins='20mm', output_file=None, **kwargs):
-    """Convert notebook with properly working page size control."""
+@dataclass(frozen=True)
+class PageSpec:
+    """Resolved page geometry: size preset, orientation, dimensions in mm and margins."""
+    size: str
+    orientation: str
+    width_mm: int
+    height_mm: int
+    margins: str
     
-    try:
-        # Get dimensions
-        if page_size.lower() in PAGE_SIZES:
-            width, height = PAGE_SIZES[page_size.lower()]
-        else:
-            print(f"❌ Unknown page size: {page_size}")
-            return False
+    @classmethod
+    def from_args(cls, size='a4', orientation='portrait', margins='20mm'):
+        """Look up a size preset and apply the orientation; raises ValueError if unknown."""
+        size_key = size.lower()
+        if size_key not in _NORMALIZED_SIZES:
+            raise ValueError(f"Unknown page size: {size}")
+        width, height = _NORMALIZED_SIZES[size_key]
         
         # Swap for landscape
-        if orientation.lower() == 'landscape':
+        orientation = orientation.lower()
+        if orientation == 'landscape':
             width, height = height, width
         
-        print(f"📄 Target: {page_size.upper()} {orientation} ({width}×{height}mm)")
-        
-        # Create temporary custom template
-        template_content = create_custom_html_template(page_size, orientation, margins)
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html.j2', delete=False) as f:
-            f.write(template_content)
-            template_file = f.name
-        
+        return cls(size_key, orientation, width, height, margins)
+    
+    @property
+    def file_suffix(self):
+        """Output filename suffix naming the size; empty for the default A4 portrait."""
+        if self.size == 'a4' and self.orientation == 'portrait':
+            return ""
+        return f"_{self.size}_{self.orientation}"
+    
+    def describe(self):
+        """Human-readable summary, e.g. 'A3 landscape (420×297mm)'."""
+        return f"{self.size.upper()} {self.orientation} ({self.width_mm}×{self.height_mm}mm)"
+
+@functools.lru_cache(maxsize=64)
+def create_custom_html_template(page):
+    """Create custom HTML template with proper @page CSS rules.
+
+    The result depends only on the (hashable) PageSpec, so it is memoized.
+    """
+    return _CUSTOM_TEMPLATE.substitute(width=page.width_mm, height=page.height_mm, margins=page.margins)
+
+def _load_notebook_json(path):
+    """Read a notebook file into a dict, preferring orjson when it is installed.
+
+    Notebooks above ``_STREAM_PARSE_BYTES`` are parsed incrementally with ijson
+    when it is available, so the raw file never sits in memory next to the dict.
+    """
+    path = Path(path)
+    if ijson is not None and path.stat().st_size > _STREAM_PARSE_BYTES:
+        with path.open('rb') as f:
+            return next(ijson.items(f, '', use_float=True))
+    data = path.read_bytes()
+    if orjson is not None:
         try:
-            # Create configuration
-            config = Config()
-            config.WebPDFExporter.template_file = template_file
-            
-            # Create exporter
-            exporter = WebPDFExporter(config=config)
-            exporter.allow_chromium_download = True
-            
-            # Apply content options
-            if kwargs.get('no_input', False):
-                exporter.exclude_input = True
-            if kwargs.get('no_prompt', False):
-                exporter.exclude_input_prompt = True
-                exporter.exclude_output_prompt = True
-            
-            # Generate filename
-            if output_file is None:
-                base = Path(notebook_file).stem
-                size_suffix = f"_{page_size}_{orientation}" if page_size != 'a4' or orientation != 'portrait' else ""
-                output_file = f"{base}_sized{size_suffix}.pdf"
-            else:
-                output_file = output_file + '.pdf'
-            
-            print(f"🔄 Converting with custom template...")
-            
-            # Convert
-            (body, resources) = exporter.from_filename(notebook_file)
-            
-            # Write file
-            with open(output_file, 'wb') as f:
-                f.write(body)
-            
-            file_size = os.path.getsize(output_file) / (1024 * 1024)
-            print(f"✅ Created: {output_file} ({file_size:.1f} MB)")
-            
-            return True
-            
-        finally:
-            # Clean up template file
-            try:
-                os.unlink(template_file)
-            except:
-                pass
-                
-    except Exception as e:
-        print(f"❌ Conversion failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. integers wider than 64 bits; let the stdlib parser decide
+    return json.loads(data)
 
-def convert_with_playwright_direct(notebook_file, page_size='a4', orientation='portrait',
-                                  margins='20mm', output_file=None, **kwargs):
-    """Alternative method using Playwright directly for better page size control."""
+def _dump_json_bytes(obj):
+    """Serialize to UTF-8 JSON bytes, preferring orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass  # orjson.JSONEncodeError, e.g. integers wider than 64 bits
+    return json.dumps(obj).encode('utf-8')
+
+def _notebook_node_from_dict(notebook):
+    """Turn parsed notebook JSON into a v4 NotebookNode, as nbformat.read() would.
+
+    The per-version reader rejoins multi-line sources stored as lists of lines.
+    """
+    major, minor = nbformat.reader.get_version(notebook)
+    if major not in nbformat.versions:
+        raise nbformat.NBFormatError(f"Unsupported nbformat version {major}")
+    nb_node = nbformat.versions[major].to_notebook_json(notebook, minor=minor)
+    return nbformat.convert(nb_node, 4)
+
+# Classic template plus a hook for extra <head> content, passed in through resources
+_PLAYWRIGHT_HTML_TEMPLATE = """
+{%- extends "classic/index.html.j2" -%}
+
+{%- block html_head_css -%}
+{{ super() }}
+{{ resources.jamboree_head }}
+{%- endblock html_head_css -%}
+"""
+
+@functools.lru_cache(maxsize=8)
+def _get_html_exporter(no_input=False, no_prompt=False):
+    """Return a shared classic-template HTMLExporter for the given content options.
+
+    Building an exporter loads its Jinja environment and traitlets config, so this is
+    done once per option set instead of once per conversion.
+    """
+    config = Config()
+    
+    # Use the classic template which handles outputs better
+    config.HTMLExporter.template_name = 'classic'
+    
+    exporter = HTMLExporter(config=config)
+    exporter.raw_template = _PLAYWRIGHT_HTML_TEMPLATE
+    
+    if no_input:
+        exporter.exclude_input = True
+    if no_prompt:
+        exporter.exclude_input_prompt = True
+        exporter.exclude_output_prompt = True
+    
+    return exporter
+
+@functools.lru_cache(maxsize=8)
+def _get_template_exporter(template_content, no_input=False, no_prompt=False):
+    """Return a shared lab-template HTMLExporter for the given template source and content options."""
+    exporter = HTMLExporter()
+    
+    # Keep the template in memory; nbconvert resolves `extends` against its own template paths.
+    exporter.raw_template = template_content
+    
+    # Apply content options
+    if no_input:
+        exporter.exclude_input = True
+    if no_prompt:
+        exporter.exclude_input_prompt = True
+        exporter.exclude_output_prompt = True
+    
+    return exporter
+
+def convert_with_working_pagesize(notebook_file, page, output_file=None, **kwargs):
+    """Convert notebook with properly working page size control.
+
+    ``page`` is the PageSpec to print to.
+    """
+    
+    notebook_path = Path(notebook_file)
+    stem = notebook_path.stem
     
     try:
-        from playwright.sync_api import sync_playwright
-        import json
-        
-        # Get dimensions
-        if page_size.lower() in PAGE_SIZES:
-            width, height = PAGE_SIZES[page_size.lower()]
-        else:
-            print(f"❌ Unknown page size: {page_size}")
-            return False
-        
-        # Swap for landscape
-        if orientation.lower() == 'landscape':
-            width, height = height, width
-        
-        print(f"📄 Playwright: {page_size.upper()} {orientation} ({width}×{height}mm)")
-        
-        # Read notebook to extract Plotly data
-        print("📖 Reading notebook and extracting Plotly charts...")
-        with open(notebook_file, 'r') as f:
-            notebook = json.load(f)
-        
-        # Extract all Plotly outputs and inject deterministic placeholders so charts render in-place.
-        plotly_charts = []
-        plotly_index = 0
-        for cell in notebook.get('cells', []):
-            if cell.get('cell_type') == 'code':
-                for output in cell.get('outputs', []):
-                    if 'data' in output and 'application/vnd.plotly.v1+json' in output['data']:
-                        plotly_charts.append(output['data']['application/vnd.plotly.v1+json'])
-                        placeholder_id = f"jamboree-plotly-{plotly_index}"  # deterministic ordering
-                        plotly_index += 1
-
-                        if 'data' not in output:
-                            output['data'] = {}
-                        output['data']['text/html'] = f'<div id="{placeholder_id}" class="jamboree-plotly-placeholder"></div>'
-        
-        print(f"📊 Found {len(plotly_charts)} Plotly chart(s) in notebook")
+        logger.info(f"📄 Target: {page.describe()}")
         
-        # First convert to HTML - no custom template needed
-        config = Config()
+        # Build (or reuse) an exporter for this template and content options
+        template_content = create_custom_html_template(page)
+        exporter = _get_template_exporter(
+            template_content, kwargs.get('no_input', False), kwargs.get('no_prompt', False)
+        )
         
-        # Use the classic template which handles outputs better
-        config.HTMLExporter.template_name = 'classic'
+        # Generate filename
+        if output_file is None:
+            output_file = f"{stem}_sized{page.file_suffix}.pdf"
+        else:
+            output_file = output_file + '.pdf'
         
-        exporter = HTMLExporter(config=config)
+        logger.info(f"🔄 Converting with custom template...")
         
-        if kwargs.get('no_input', False):
-            exporter.exclude_input = True
-        if kwargs.get('no_prompt', False):
-            exporter.exclude_input_prompt = True
-            exporter.exclude_output_prompt = True
+        # Convert; the parsed JSON is kept around to check it for math
+        notebook = _load_notebook_json(notebook_path)
+        (body, resources) = exporter.from_notebook_node(
+            _notebook_node_from_dict(notebook),
+            resources={'metadata': {'name': stem, 'path': str(notebook_path.parent)}},
+        )
         
-        print("🔄 Converting to HTML...")
-        with warnings.catch_warnings():
-            warnings.filterwarnings(
-                "ignore",
-                message=r"Your element with mimetype\(s\) dict_keys\(\['application/vnd\.plotly\.v1\+json'\]\) is not able to be represented\.",
-                category=UserWarning,
-            )
-            warnings.filterwarnings(
-                "ignore",
-                message=r"IPython3 lexer unavailable, falling back on Python 3",
-                category=UserWarning,
-            )
-            # Convert from a temporary notebook file so we don't mutate the source file.
-            temp_notebook_file = None
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.ipynb', delete=False) as nf:
-                json.dump(notebook, nf)
-                temp_notebook_file = nf.name
+        # Print through Playwright so Chromium writes the PDF straight to disk
+        # instead of handing the whole document back as Python bytes.
+        spec = RenderSpec(
+            html=body,
+            base_url=notebook_path.resolve().parent.as_uri() + '/',
+            targets=[PdfTarget(output_file, page)],
+            has_math=_notebook_has_math(notebook),
+        )
+        return _render_pdfs([spec])[0]
+                
+    except ImportError:
+        logger.error("❌ Playwright not available. Install with: pip install playwright")
+        return False
+    except Exception as e:
+        logger.exception(f"❌ Conversion failed: {e}")
+        return False
 
-            try:
-                (html_body, resources) = exporter.from_filename(temp_notebook_file)
-            finally:
+def convert_batch_with_template(notebook_files, pages, output_file=None, **kwargs):
+    """Convert several notebooks with the template method, one after another.
+
+    The template bakes the page size into the HTML, so each PageSpec in
+    ``pages`` is a separate conversion.
+    """
+    success = True
+    for notebook_file in notebook_files:
+        for page in pages:
+            page_output = output_file
+            if output_file is not None and len(pages) > 1:
+                page_output = f"{output_file}_{page.size}_{page.orientation}"
+            result = convert_with_working_pagesize(notebook_file, page, page_output, **kwargs)
+            success = success and result
+    return success
+
+def _downscale_notebook_images(notebook, max_width_px):
+    """Shrink large embedded PNG/JPEG outputs far wider than max_width_px, in place.
+
+    Chromium re-encodes every embedded image into the PDF, so oversized
+    figures cost both render time and file size. Images are reduced by a
+    whole factor (a cheap box filter) and never below max_width_px.
+    Returns the number resized.
+    """
+    if Image is None or max_width_px <= 0:
+        return 0
+    
+    resized = 0
+    for cell in notebook.get('cells', []):
+        for output in cell.get('outputs', []):
+            data = output.get('data', {})
+            for mimetype, image_format in (('image/png', 'PNG'), ('image/jpeg', 'JPEG')):
+                encoded = data.get(mimetype)
+                if not encoded:
+                    continue
+                if isinstance(encoded, list):
+                    encoded = ''.join(encoded)
+                # Base64 is 4/3 the decoded size; small images aren't worth decoding
+                if len(encoded) * 3 // 4 < _IMAGE_MIN_BYTES:
+                    continue
                 try:
-                    if temp_notebook_file:
-                        os.unlink(temp_notebook_file)
+                    # Image.open only reads the header, so the width check is cheap
+                    img = Image.open(BytesIO(base64.b64decode(encoded)))
+                    factor = img.width // max_width_px
+                    if factor < _IMAGE_MIN_FACTOR:
+                        continue
+                    img = img.reduce(factor)
+                    buffer = BytesIO()
+                    if image_format == 'JPEG':
+                        img.save(buffer, 'JPEG', quality=85)
+                    else:
+                        img.save(buffer, 'PNG')
                 except Exception:
-                    pass
+                    # Leave anything PIL can't handle untouched
+                    continue
+                data[mimetype] = base64.b64encode(buffer.getvalue()).decode('ascii')
+                resized += 1
+    return resized
 
-        has_math = bool(re.search(r"\\\(|\\\[|\$\$|\\begin\{", html_body))
-        
-        # Add page size CSS to HTML
-        page_css = f"""
-        <style>
-        @page {{
-            size: {width}mm {height}mm;
-            margin: {margins};
-        }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            font-size: 11pt;
-            line-height: 1.4;
-            margin: 0;
-            padding: {margins};
-        }}
-        .jp-Notebook {{
-            max-width: none;
-            width: 100%;
-        }}
-        /* Preserve math rendering */
-        .MathJax, .MathJax_Display, mjx-container {{
-            overflow-x: auto;
-            overflow-y: visible;
-        }}
-        </style>
-        """
-        
-        # Embed Plotly charts data and library
-        plotly_data_json = json.dumps(plotly_charts)
+def _notebook_has_math(notebook):
+    """Return True if any markdown cell or Markdown/LaTeX output contains math.
 
-        plotly_src = None
-        try:
-            import plotly  # type: ignore
-            candidate = Path(plotly.__file__).parent / 'package_data' / 'plotly.min.js'
-            if candidate.exists():
-                plotly_src = candidate.as_uri()
-        except ModuleNotFoundError:
-            plotly_src = None
-
-        plotly_script = """
-        __PLOTLY_SCRIPT_TAG__
-        <script>
-        // Embedded Plotly chart data
-        var plotlyChartsData = __PLOTLY_DATA_JSON__;
-        window.plotlyRenderingComplete = false;
-        window.plotlyRenderedCount = 0;
-        window.plotlyRenderStarted = false;
-        window.plotlyRenderFailed = false;
-        window.plotlyLastError = null;
-        window.plotlyLoadStartTime = Date.now();
-
-        function markPlotlyComplete() {
-            window.plotlyRenderingComplete = true;
-        }
+    Checking the sources keeps this O(source) rather than a scan of the rendered HTML.
+    """
+    for cell in notebook.get('cells', []):
+        if cell.get('cell_type') == 'markdown' and _MATH_RE.search(''.join(cell.get('source', ''))):
+            return True
+        for output in cell.get('outputs', []):
+            data = output.get('data', {})
+            if 'text/latex' in data:
+                return True
+            if 'text/markdown' in data and _MATH_RE.search(''.join(data['text/markdown'])):
+                return True
+    return False
+
+@dataclass
+class PdfTarget:
+    """A PDF file to print and the page it is printed on."""
+    output_file: str
+    page: PageSpec
 
-        function renderPlotlyCharts() {
-            if (window.plotlyRenderStarted) return;
+@dataclass
+class RenderSpec:
+    """One notebook's print-ready HTML and the PDF(s) it should be printed to."""
+    html: str
+    base_url: str
+    targets: list[PdfTarget]
+    plotly_count: int = 0
+    has_math: bool = False
+    debug_html: str | None = None
 
-            if (plotlyChartsData.length === 0) {
+# Plotly chart renderer injected into the page; __PLOTLY_DATA_JSON__ is filled in per conversion
+_PLOTLY_RENDER_JS = """
+    // Embedded Plotly chart data
+    var plotlyChartsData = __PLOTLY_DATA_JSON__;
+    window.plotlyRenderingComplete = false;
+    window.plotlyRenderedCount = 0;
+    window.plotlyRenderStarted = false;
+    window.plotlyRenderFailed = false;
+    window.plotlyLastError = null;
+    window.plotlyLoadStartTime = Date.now();
+    window.plotlyRetryDelay = 50;
+
+    function markPlotlyComplete() {
+        window.plotlyRenderingComplete = true;
+    }
+
+    function renderPlotlyCharts() {
+        if (window.plotlyRenderStarted) return;
+
+        if (plotlyChartsData.length === 0) {
+            markPlotlyComplete();
+            return;
+        }
+
+        if (typeof Plotly === 'undefined') {
+            if ((Date.now() - window.plotlyLoadStartTime) > 60000) {
+                console.warn('Plotly did not load within 60s; skipping chart rendering');
+                window.plotlyRenderFailed = true;
                 markPlotlyComplete();
                 return;
             }
+            // Plotly might still be loading (CDN slow/blocked). Retry for a while,
+            // starting quickly and backing off to at most once a second.
+            setTimeout(renderPlotlyCharts, window.plotlyRetryDelay);
+            window.plotlyRetryDelay = Math.min(window.plotlyRetryDelay * 2, 1000);
+            return;
+        }
+
+        window.plotlyRenderStarted = true;
+        console.log('Found ' + plotlyChartsData.length + ' Plotly charts to render');
+
+        // Prefer deterministic in-place placeholders injected into the notebook outputs.
+        var candidates = Array.from(document.querySelectorAll('.jamboree-plotly-placeholder'));
+
+        // If nbconvert didn't include any recognizable placeholders, render at the end
+        if (candidates.length === 0) {
+            console.warn('No Plotly placeholders detected in HTML; rendering charts at end of document');
+            var container = document.createElement('div');
+            container.id = 'plotly-fallback-container';
+            document.body.appendChild(container);
+            candidates = [container];
+        }
 
-            if (typeof Plotly === 'undefined') {
-                if ((Date.now() - window.plotlyLoadStartTime) > 60000) {
-                    console.warn('Plotly did not load within 60s; skipping chart rendering');
-                    window.plotlyRenderFailed = true;
-                    markPlotlyComplete();
-                    return;
+        // Build every chart div first so the document is laid out once, then render
+        // them all together: placeholders in order, any extra charts at the end.
+        var fallbackContainer = document.getElementById('plotly-fallback-container');
+        var divs = plotlyChartsData.map(function(_, i) {
+            var area = candidates[i];
+            if (!area) {
+                if (!fallbackContainer) {
+                    fallbackContainer = document.createElement('div');
+                    fallbackContainer.id = 'plotly-fallback-container';
+                    document.body.appendChild(fallbackContainer);
                 }
-                // Plotly might still be loading (CDN slow/blocked). Retry for a while.
-                setTimeout(renderPlotlyCharts, 250);
-                return;
+                area = document.createElement('div');
+                fallbackContainer.appendChild(area);
             }
 
-            window.plotlyRenderStarted = true;
-            console.log('Found ' + plotlyChartsData.length + ' Plotly charts to render');
+            var div = document.createElement('div');
+            div.className = 'plotly-graph-div';
+            div.style.width = '100%';
+            div.style.height = '500px';
+            div.style.marginBottom = '20px';
+
+            // Replace placeholder contents with the chart div
+            area.innerHTML = '';
+            area.appendChild(div);
+            return div;
+        });
 
-            // Prefer deterministic in-place placeholders injected into the notebook outputs.
-            var candidates = Array.from(document.querySelectorAll('.jamboree-plotly-placeholder'));
+        // A print never resizes, so skip Plotly's resize listeners and interactivity
+        var plotConfig = {responsive: false, staticPlot: true, displayModeBar: false};
 
-            // If nbconvert didn't include any recognizable placeholders, render at the end
-            if (candidates.length === 0) {
-                console.warn('No Plotly placeholders detected in HTML; rendering charts at end of document');
-                var container = document.createElement('div');
-                container.id = 'plotly-fallback-container';
-                document.body.appendChild(container);
-                candidates = [container];
+        Promise.all(plotlyChartsData.map(function(chartData, i) {
+            return Promise.resolve().then(function() {
+                return Plotly.newPlot(divs[i], chartData.data, chartData.layout, plotConfig);
+            }).catch(function(e) {
+                // Keep going: one broken chart shouldn't hold up the others
+                console.error('Failed to render chart ' + (i + 1) + ':', e);
+                window.plotlyLastError = String(e);
+            }).then(function() {
+                window.plotlyRenderedCount++;
+            });
+        })).then(function() {
+            console.log('All Plotly charts rendering complete!');
+            markPlotlyComplete();
+        });
+
+        // Fallback: mark complete after timeout even if promises don't resolve
+        setTimeout(function() {
+            if (!window.plotlyRenderingComplete) {
+                console.warn('Plotly rendering timeout fallback triggered');
+                window.plotlyRenderFailed = true;
+                markPlotlyComplete();
             }
+        }, 120000);
+    }
+    
+    // Start rendering after DOM is ready; actual chart rendering waits until Plotly exists.
+    if (document.readyState === 'complete' || document.readyState === 'interactive') {
+        renderPlotlyCharts();
+    } else {
+        document.addEventListener('DOMContentLoaded', renderPlotlyCharts);
+    }
+    """
 
-            var chartIndex = 0;
+def _render_plotly_svg(figure, width_px):
+    """Worker-process entry point: export one Plotly figure to SVG markup.
 
-            function renderInto(targetArea, chartData) {
-                var div = document.createElement('div');
-                div.className = 'plotly-graph-div';
-                div.style.width = '100%';
-                div.style.height = '500px';
-                div.style.marginBottom = '20px';
+    Like the Plotly.js path, a width or height set in the figure's layout wins;
+    otherwise the chart spans the column and is 500px tall.
+    """
+    layout = figure.get('layout') or {}
+    width = None if layout.get('width') else width_px
+    height = None if layout.get('height') else 500
+    return pio.to_image(figure, format='svg', width=width, height=height, validate=False).decode('utf-8')
 
-                // Replace placeholder contents with the chart div
-                targetArea.innerHTML = '';
-                targetArea.appendChild(div);
+def _prerender_plotly_svgs(figures, width_px):
+    """Export Plotly figures to inline SVG with Kaleido; None marks a chart left to Plotly.js.
 
-                return Plotly.newPlot(div, chartData.data, chartData.layout, {
-                    responsive: true,
-                    displayModeBar: false
-                });
-            }
+    Each export drives its own Kaleido browser, so several charts are exported in
+    a few parallel worker processes; inside a --jobs or --method both worker, where
+    the cores are already shared out, they are exported one after another. Without
+    Kaleido every entry is None; once an export fails (e.g. Kaleido can't find a
+    browser to drive) later notebooks skip it too.
+    """
+    global _KALEIDO_BROKEN
+    svgs = [None] * len(figures)
+    if pio is None or _KALEIDO_BROKEN or not figures:
+        return svgs
 
-            // Render charts into detected candidates first, then append remaining to end
-            for (var i = 0; i < candidates.length && chartIndex < plotlyChartsData.length; i++) {
-                (function(area, data) {
-                    try {
-                        console.log('Rendering chart ' + (chartIndex + 1));
-                        renderInto(area, data).then(function() {
-                            window.plotlyRenderedCount++;
-                            if (window.plotlyRenderedCount >= plotlyChartsData.length) {
-                                console.log('All Plotly charts rendering complete!');
-                                markPlotlyComplete();
-                            }
-                        }).catch(function(e) {
-                            console.error('Failed to render chart:', e);
-                            window.plotlyLastError = String(e);
-                            window.plotlyRenderedCount++;
-                            if (window.plotlyRenderedCount >= plotlyChartsData.length) markPlotlyComplete();
-                        });
-                    } catch (e) {
-                        console.error('Failed to render chart:', e);
-                        window.plotlyLastError = String(e);
-                        window.plotlyRenderedCount++;
-                        if (window.plotlyRenderedCount >= plotlyChartsData.length) markPlotlyComplete();
-                    }
-                })(candidates[i], plotlyChartsData[chartIndex]);
-                chartIndex++;
-            }
+    workers = min(len(figures), os.cpu_count() or 1, _KALEIDO_MAX_WORKERS)
+    if multiprocessing.parent_process() is not None:
+        workers = 1
+    if workers == 1:
+        results = []
+        for figure in figures:
+            try:
+                results.append(_render_plotly_svg(figure, width_px))
+            except Exception as e:
+                results.append(e)
+                break
+    else:
+        # Don't fork while the Chromium prewarm thread may still be running
+        wait_for_chromium()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_render_plotly_svg, figure, width_px) for figure in figures]
+            results = [future.exception() or future.result() for future in futures]
 
-            if (chartIndex < plotlyChartsData.length) {
-                var fallbackContainer = document.getElementById('plotly-fallback-container');
-                if (!fallbackContainer) {
-                    fallbackContainer = document.createElement('div');
-                    fallbackContainer.id = 'plotly-fallback-container';
-                    document.body.appendChild(fallbackContainer);
-                }
+    for i, result in enumerate(results):
+        if isinstance(result, BaseException):
+            if not _KALEIDO_BROKEN:
+                logger.warning(f"⚠️  Kaleido export failed, rendering Plotly charts in the browser: {result}")
+                _KALEIDO_BROKEN = True
+        else:
+            svgs[i] = result
+    return svgs
 
-                for (; chartIndex < plotlyChartsData.length; chartIndex++) {
-                    (function(data) {
-                        try {
-                            var holder = document.createElement('div');
-                            fallbackContainer.appendChild(holder);
-                            renderInto(holder, data).then(function() {
-                                window.plotlyRenderedCount++;
-                                if (window.plotlyRenderedCount >= plotlyChartsData.length) markPlotlyComplete();
-                            }).catch(function(e) {
-                                console.error('Failed to render chart (fallback):', e);
-                                window.plotlyLastError = String(e);
-                                window.plotlyRenderedCount++;
-                                if (window.plotlyRenderedCount >= plotlyChartsData.length) markPlotlyComplete();
-                            });
-                        } catch (e) {
-                            console.error('Failed to render chart (fallback):', e);
-                            window.plotlyLastError = String(e);
-                            window.plotlyRenderedCount++;
-                            if (window.plotlyRenderedCount >= plotlyChartsData.length) markPlotlyComplete();
-                        }
-                    })(plotlyChartsData[chartIndex]);
-                }
-            }
+@functools.lru_cache(maxsize=1)
+def _plotly_js():
+    """Source of plotly.min.js from the installed plotly package (read once), or None."""
+    try:
+        import plotly  # type: ignore
+        candidate = Path(plotly.__file__).parent / 'package_data' / 'plotly.min.js'
+        if candidate.exists():
+            # Keep the inline copy from ending the <script> element early
+            return candidate.read_text(encoding='utf-8').replace('</script', '<\\/script')
+    except ModuleNotFoundError:
+        pass
+    return None
 
-            // Fallback: mark complete after timeout even if promises don't resolve
-            setTimeout(function() {
-                if (!window.plotlyRenderingComplete) {
-                    console.warn('Plotly rendering timeout fallback triggered');
-                    window.plotlyRenderFailed = true;
-                    markPlotlyComplete();
-                }
-            }, 120000);
-        }
-        
-        // Start rendering after DOM is ready; actual chart rendering waits until Plotly exists.
-        if (document.readyState === 'complete' || document.readyState === 'interactive') {
-            renderPlotlyCharts();
-        } else {
-            document.addEventListener('DOMContentLoaded', renderPlotlyCharts);
+def _minify(source, minifier):
+    """Minify injected CSS/JS when the minifier is installed; kept readable for JAMBOREE_DEBUG_HTML=1."""
+    if minifier is None or os.environ.get('JAMBOREE_DEBUG_HTML') == '1':
+        return source
+    return minifier(source)
+
+# id of the <style> element holding the page geometry, swapped before each PDF target is printed
+_PAGE_STYLE_ID = 'jamboree-page'
+
+def _page_geometry_css(width, height, margins):
+    """The @page rule and body padding for one page geometry."""
+    return f"@page {{ size: {width}mm {height}mm; margin: {margins}; }} body {{ padding: {margins}; }}"
+
+@functools.lru_cache(maxsize=64)
+def _build_page_css(width, height, margins):
+    """<style> elements for <head> at one page geometry."""
+    page_css = f"""
+    body {{
+        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+        font-size: 11pt;
+        line-height: 1.4;
+        margin: 0;
+    }}
+    .jp-Notebook {{
+        max-width: none;
+        width: 100%;
+    }}
+    /* Preserve math rendering */
+    .MathJax, .MathJax_Display, mjx-container {{
+        overflow-x: auto;
+        overflow-y: visible;
+    }}
+    /* Long values wrap inside their column instead of spilling into the next one */
+    th, td {{
+        overflow-wrap: anywhere;
+    }}
+    /* Let Chromium lay out each output as an isolated subtree */
+    .jp-OutputArea-output, div.output_subarea {{
+        contain: layout style;
+    }}
+    /* Charts pre-rendered by Kaleido scale to the column like the JS-rendered ones */
+    .jamboree-plotly-static svg {{
+        width: 100%;
+        height: auto;
+        margin-bottom: 20px;
+    }}
+    """
+    return (
+        f"<style>{_minify(page_css, rcssmin and rcssmin.cssmin)}</style>\n"
+        f'<style id="{_PAGE_STYLE_ID}">{_page_geometry_css(width, height, margins)}</style>'
+    )
+
+@functools.lru_cache(maxsize=1)
+def _plotly_head_scripts():
+    """Plotly library and renderer <script>s, split around where the chart data goes.
+
+    Cached once rather than per page geometry: with plotly.min.js inlined this is several MB.
+    """
+    plotly_js = _plotly_js()
+    if plotly_js:
+        # Inline the library so the page needs no subresource fetch to draw charts
+        plotly_script_tag = f'<script>{plotly_js}</script>'
+    else:
+        # Last resort: CDN (may be blocked in some environments)
+        plotly_script_tag = '<script src="https://cdn.plot.ly/plotly-2.32.0.min.js" charset="utf-8"></script>'
+
+    scripts = f"{plotly_script_tag}\n<script>{_minify(_PLOTLY_RENDER_JS, rjsmin and rjsmin.jsmin)}</script>"
+    scripts_start, _, scripts_end = scripts.partition('__PLOTLY_DATA_JSON__')
+    return scripts_start, scripts_end
+
+def _build_html_head(width, height, margins, plotly_data_json=None):
+    """Page CSS for <head>, plus the Plotly scripts drawing ``plotly_data_json`` if given."""
+    page_css = _build_page_css(width, height, margins)
+    if plotly_data_json is None:
+        return page_css
+    scripts_start, scripts_end = _plotly_head_scripts()
+    # Splice the (possibly multi-MB) chart data in with one join instead of str.replace()
+    return ''.join((page_css, '\n', scripts_start, plotly_data_json, scripts_end))
+
+# Output MIME types the fast path knows how to show, in nbconvert's display priority order
+_FAST_MIME_PRIORITY = ('text/html', 'image/svg+xml', 'image/png', 'image/jpeg', 'text/markdown', 'text/plain')
+
+# Bare page for the fast path; $head carries the same CSS and Plotly script as the nbconvert route
+_FAST_HTML_PAGE = string.Template("""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8" />
+<title>$title</title>
+<style type="text/css">
+    img, svg { max-width: 100%; height: auto; }
+    pre { white-space: pre-wrap; word-wrap: break-word; font-size: 9.5pt; margin: 0; }
+    .output_stderr { background: #fdd; }
+    .output_area { margin: 0.4em 0; overflow-x: auto; }
+    .rendered_html table { border-collapse: collapse; font-size: 9pt; margin: 0.5em 0; }
+    .rendered_html th, .rendered_html td { padding: 0.25em 0.5em; text-align: right; border-bottom: 1px solid #ddd; }
+</style>
+$head
+</head>
+<body>
+$body
+</body>
+</html>
+""")
+
+def _can_render_fast(notebook):
+    """Whether the notebook's visible content is within what _render_html_fast handles.
+
+    Anything with math, cell attachments or LaTeX outputs goes through nbconvert.
+    """
+    for cell in notebook.get('cells', []):
+        if cell.get('attachments'):
+            return False
+        # Even a lone '$' may be something the notebook's Markdown treats as math
+        if cell.get('cell_type') == 'markdown' and '$' in ''.join(cell.get('source', '')):
+            return False
+    return not _notebook_has_math(notebook)
+
+def _render_output_fast(output):
+    """Render one code cell output as HTML, or '' if nothing in it can be shown."""
+    output_type = output.get('output_type')
+    if output_type == 'stream':
+        css_class = 'output_stderr' if output.get('name') == 'stderr' else 'output_stdout'
+        return f'<div class="output_area {css_class}"><pre>{ansi2html("".join(output.get("text", "")))}</pre></div>'
+    if output_type == 'error':
+        traceback = '\n'.join(output.get('traceback', []))
+        return f'<div class="output_area output_stderr"><pre>{ansi2html(traceback)}</pre></div>'
+
+    data = output.get('data', {})
+    for mime in _FAST_MIME_PRIORITY:
+        if mime not in data:
+            continue
+        value = ''.join(data[mime]) if isinstance(data[mime], list) else data[mime]
+        if mime in ('text/html', 'image/svg+xml'):
+            content = value
+        elif mime in ('image/png', 'image/jpeg'):
+            size = output.get('metadata', {}).get(mime, {})
+            attrs = ''.join(f' {key}="{size[key]}"' for key in ('width', 'height') if key in size)
+            content = f'<img src="data:{mime};base64,{value.strip()}"{attrs}>'
+        elif mime == 'text/markdown':
+            content = mistune.html(value)
+        else:
+            content = f'<pre>{html.escape(value)}</pre>'
+        return f'<div class="output_area output_subarea rendered_html">{content}</div>'
+    return ''
+
+def _render_html_fast(notebook, head, title):
+    """Assemble report-style HTML (no code, no prompts) straight from the notebook JSON.
+
+    Skips nbconvert's preprocessors and Jinja templates, which dominate the HTML
+    phase for notebooks that are mostly outputs.
+    """
+    parts = []
+    for cell in notebook.get('cells', []):
+        cell_type = cell.get('cell_type')
+        if cell_type == 'markdown':
+            parts.append(f'<div class="cell text_cell rendered_html">{mistune.html("".join(cell.get("source", "")))}</div>')
+        elif cell_type == 'code':
+            outputs = ''.join(_render_output_fast(output) for output in cell.get('outputs', []))
+            if outputs:
+                parts.append(f'<div class="cell code_cell">{outputs}</div>')
+        elif cell_type == 'raw':
+            # Like nbconvert's HTML export: keep raw cells marked text/html or left unmarked
+            if cell.get('metadata', {}).get('raw_mimetype', '').lower() in ('text/html', ''):
+                parts.append(clean_html(''.join(cell.get('source', ''))))
+    return _FAST_HTML_PAGE.substitute(title=html.escape(title), head=head, body='\n'.join(parts))
+
+def _extract_and_annotate(notebook):
+    """Yield ``(output, figure)`` for each Plotly output, annotating it in place.
+
+    The Plotly JSON is popped out of the output and replaced by a deterministic
+    placeholder div, so the notebook handed to nbconvert no longer carries it.
+    """
+    index = 0
+    for cell in notebook.get('cells', []):
+        if cell.get('cell_type') != 'code':
+            continue
+        for output in cell.get('outputs', []):
+            data = output.get('data')
+            if not data or _PLOTLY_MIME not in data:
+                continue
+            figure = data.pop(_PLOTLY_MIME)
+            data['text/html'] = f'<div id="jamboree-plotly-{index}" class="jamboree-plotly-placeholder"></div>'
+            index += 1
+            yield output, figure
+
+def _build_playwright_spec(notebook_file, pages, output_file=None, **kwargs):
+    """Convert a notebook to HTML with page CSS and Plotly injected, ready for printing.
+
+    The HTML is rendered once and printed to one PDF per PageSpec in ``pages``.
+    """
+    # The HTML is laid out for the first page; _render_pdf swaps in each other page's geometry
+    width, height, margins = pages[0].width_mm, pages[0].height_mm, pages[0].margins
+    notebook_path = Path(notebook_file)
+    stem = notebook_path.stem
+    
+    # Read notebook to extract Plotly data
+    logger.info("📖 Reading notebook and extracting Plotly charts...")
+    notebook = _load_notebook_json(notebook_path)
+    
+    # Content width of the widest page; images and pre-rendered charts are sized against it
+    try:
+        margin_mm = _css_length_to_pt(margins) / _PT_PER_UNIT['mm']
+    except ValueError:
+        margin_mm = 0
+    content_mm = max(page.width_mm for page in pages) - 2 * margin_mm
+    
+    # One walk swaps every chart for a placeholder and hands over its (popped) figure
+    plotly_found = list(_extract_and_annotate(notebook))
+    logger.info(f"📊 Found {len(plotly_found)} Plotly chart(s) in notebook")
+    
+    # Charts Kaleido can export become static SVG; only the rest are left to Plotly.js,
+    # which fills the remaining placeholders in document order.
+    svgs = _prerender_plotly_svgs([figure for _, figure in plotly_found], int(content_mm * _PX_PER_MM))
+    plotly_charts = []
+    for (output, figure), svg in zip(plotly_found, svgs):
+        if svg is not None:
+            output['data']['text/html'] = f'<div class="jamboree-plotly-static">{svg}</div>'
+        else:
+            plotly_charts.append(figure)
+    if plotly_found and not plotly_charts:
+        logger.info("🖼️  Pre-rendered all Plotly charts to SVG with Kaleido")
+    
+    # Shrink embedded images that are far larger than the widest page can show
+    resized = _downscale_notebook_images(notebook, int(content_mm * _IMAGE_DPI / 25.4))
+    if resized:
+        logger.info(f"🖼️  Downscaled {resized} oversized image(s) to {_IMAGE_DPI} dpi")
+    
+    # Page CSS is cached per page size and the Plotly scripts once, so only the chart data is new here
+    if plotly_charts:
+        html_head = _build_html_head(width, height, margins, _dump_json_bytes(plotly_charts).decode('utf-8'))
+    else:
+        # Nothing left for Plotly.js to draw, so don't load it at all
+        html_head = _build_html_head(width, height, margins)
+
+    # Math rendering is expected to be handled by the notebook/nbconvert output.
+    
+    # The CSS and Plotly script are injected into <head> by the template itself
+    # (see _PLAYWRIGHT_HTML_TEMPLATE), so no post-processing pass over the HTML is needed.
+    has_math = _notebook_has_math(notebook)
+    
+    logger.info("🔄 Converting to HTML...")
+    if kwargs.get('no_input') and kwargs.get('no_prompt') and _can_render_fast(notebook):
+        # Report-style output with nothing nbconvert is needed for: build the HTML directly
+        html_with_css = _render_html_fast(notebook, html_head, stem)
+    else:
+        # Convert the (already modified) notebook in memory rather than writing it
+        # back out for nbconvert to re-read; it never touches the source file.
+        exporter = _get_html_exporter(kwargs.get('no_input', False), kwargs.get('no_prompt', False))
+        resources = {
+            'metadata': {'name': stem, 'path': str(notebook_path.parent)},
+            'jamboree_head': html_head,
         }
-        </script>
-        """.replace('__PLOTLY_DATA_JSON__', plotly_data_json)
+        (html_with_css, resources) = exporter.from_notebook_node(
+            _notebook_node_from_dict(notebook), resources=resources
+        )
+
 
-        plotly_script_tag = ''
-        if plotly_src:
-            plotly_script_tag = f'<script src="{plotly_src}" charset="utf-8"></script>'
+    debug_html = None
+    if os.environ.get('JAMBOREE_DEBUG_HTML') == '1':
+        debug_html = stem + '_debug.html'
+        Path(debug_html).write_text(html_with_css, encoding='utf-8')
+        logger.info(f"📝 Debug HTML saved: {debug_html}")
+
+    targets = []
+    for page in pages:
+        if output_file is None:
+            target_file = f"{stem}_playwright{page.file_suffix}.pdf"
+        elif len(pages) > 1:
+            # Several sizes share one --output name; keep them apart by size
+            target_file = f"{output_file}_{page.size}_{page.orientation}.pdf"
         else:
-            # Last resort: CDN (may be blocked in some environments)
-            plotly_script_tag = '<script src="https://cdn.plot.ly/plotly-2.32.0.min.js" charset="utf-8"></script>'
+            target_file = output_file + '.pdf'
+        targets.append(PdfTarget(target_file, page))
+
+    return RenderSpec(
+        html=html_with_css,
+        # Trailing slash so relative asset paths resolve inside the notebook's directory
+        base_url=notebook_path.resolve().parent.as_uri() + '/',
+        targets=targets,
+        plotly_count=len(plotly_charts),
+        has_math=has_math,
+        debug_html=debug_html,
+    )
 
-        plotly_script = plotly_script.replace('__PLOTLY_SCRIPT_TAG__', plotly_script_tag)
+# Background Chromium install check started by prewarm_chromium()
+_CHROMIUM_PREWARM = None
 
-        # Math rendering is expected to be handled by the notebook/nbconvert output.
-        
-        # Inject CSS and Plotly script into HTML
-        html_with_css = html_body.replace('</head>', page_css + plotly_script + '</head>')
+def _ensure_chromium():
+    """Make sure Playwright's Chromium build is installed, downloading it if needed."""
+    try:
+        from playwright.sync_api import sync_playwright
+        with sync_playwright() as p:
+            executable = p.chromium.executable_path
+        if not os.path.exists(executable):
+            logger.info("⬇️  Chromium not found; downloading it with Playwright...")
+            subprocess.run([sys.executable, '-m', 'playwright', 'install', 'chromium'], check=True)
+    except Exception as e:
+        logger.warning(f"⚠️  Chromium check failed: {e}")
 
-        debug_html = None
-        if os.environ.get('JAMBOREE_DEBUG_HTML') == '1':
-            debug_html = Path(notebook_file).stem + '_debug.html'
-            with open(debug_html, 'w') as f:
-                f.write(html_with_css)
-            print(f"📝 Debug HTML saved: {debug_html}")
+def prewarm_chromium():
+    """Start the Chromium install check in a background thread.
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-            f.write(html_with_css)
-            html_file = f.name
+    On a fresh machine the download would otherwise block the first conversion;
+    this way it overlaps with the nbconvert HTML export.
+    """
+    global _CHROMIUM_PREWARM
+    if _CHROMIUM_PREWARM is None:
+        _CHROMIUM_PREWARM = threading.Thread(target=_ensure_chromium, daemon=True)
+        _CHROMIUM_PREWARM.start()
 
+def wait_for_chromium():
+    """Block until a pending prewarm_chromium() check has finished."""
+    if _CHROMIUM_PREWARM is not None:
+        _CHROMIUM_PREWARM.join()
+
+# Lazily launched (event loop, playwright, browser) shared by every conversion in the process
+_PLAYWRIGHT_SINGLETON = None
+_PLAYWRIGHT_LOCK = threading.Lock()
+
+def _chromium_launch_options():
+    """Launch arguments for Chromium; the sandbox stays on unless JAMBOREE_NO_SANDBOX=1.
+
+    Disabling it saves a little startup time and is often required in containers
+    running as root, but notebook HTML is then rendered without process isolation.
+    """
+    if os.environ.get('JAMBOREE_NO_SANDBOX') == '1':
+        return {'args': _CHROMIUM_ARGS + ['--no-sandbox'], 'chromium_sandbox': False}
+    return {'args': _CHROMIUM_ARGS, 'chromium_sandbox': True}
+
+def _get_browser():
+    """Return the process-wide ``(loop, browser)``, launching Chromium on first use.
+
+    The browser lives on its own event loop so it can outlast any one
+    conversion; callers must hold ``_PLAYWRIGHT_LOCK`` while using it.
+    """
+    global _PLAYWRIGHT_SINGLETON
+    if _PLAYWRIGHT_SINGLETON is not None:
+        loop, _, browser = _PLAYWRIGHT_SINGLETON
+        if browser.is_connected():
+            return loop, browser
+        # Chromium crashed or was killed; start over with a fresh one
+        _close_browser()
+
+    from playwright.async_api import async_playwright
+
+    wait_for_chromium()
+    loop = asyncio.new_event_loop()
+    try:
+        playwright = loop.run_until_complete(async_playwright().start())
         try:
-            if output_file is None:
-                base = Path(notebook_file).stem
-                size_suffix = f"_{page_size}_{orientation}" if page_size != 'a4' or orientation != 'portrait' else ""
-                output_file = f"{base}_playwright{size_suffix}.pdf"
+            browser = loop.run_until_complete(
+                playwright.chromium.launch(headless=True, **_chromium_launch_options())
+            )
+        except Exception:
+            loop.run_until_complete(playwright.stop())
+            raise
+    except Exception:
+        loop.close()
+        raise
+
+    _PLAYWRIGHT_SINGLETON = (loop, playwright, browser)
+    return loop, browser
+
+def _close_browser():
+    """Shut down the shared browser, if one was launched."""
+    global _PLAYWRIGHT_SINGLETON
+    if _PLAYWRIGHT_SINGLETON is None:
+        return
+    loop, playwright, browser = _PLAYWRIGHT_SINGLETON
+    _PLAYWRIGHT_SINGLETON = None
+    for shutdown in (browser.close, playwright.stop):
+        try:
+            loop.run_until_complete(shutdown())
+        except Exception:
+            pass
+    loop.close()
+
+atexit.register(_close_browser)
+
+def _render_pdfs(specs):
+    """Print every spec to PDF from the shared Chromium instance.
+
+    Browser startup dominates the cost of a conversion, so it is paid once per
+    process rather than once per notebook or page size. With JAMBOREE_PLUTOPRINT=1,
+    pages without JavaScript-driven content go through plutoprint instead, and
+    Chromium is only launched for whatever is left. Returns one success flag per spec.
+    """
+    results = [None] * len(specs)
+    # Opt-in: plutoprint's output is not yet on par with Chromium's for every notebook
+    if _HAS_PLUTOPRINT and os.environ.get('JAMBOREE_PLUTOPRINT') == '1':
+        for i, spec in enumerate(specs):
+            # plutoprint doesn't run JavaScript, so Plotly charts and MathJax need the browser
+            if spec.plotly_count == 0 and not spec.has_math and _render_with_plutoprint(spec):
+                results[i] = True
+
+    pending = [i for i, result in enumerate(results) if result is None]
+    if not pending:
+        return results
+
+    with _PLAYWRIGHT_LOCK:
+        loop, browser = _get_browser()
+        rendered = loop.run_until_complete(_render_pdfs_async(browser, [specs[i] for i in pending]))
+    for i, result in zip(pending, rendered):
+        results[i] = result
+    return results
+
+async def _render_pdfs_async(browser, specs):
+    """Print specs concurrently, each in its own context of the given browser."""
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_PAGES)
+
+    async def render(spec):
+        async with semaphore:
+            return await _render_pdf(browser, spec)
+
+    return await asyncio.gather(*(render(spec) for spec in specs))
+
+def _css_length_to_pt(value):
+    """Convert a CSS length such as '20mm' or '1in' to points."""
+    match = re.fullmatch(r"\s*([0-9]*\.?[0-9]+)\s*([a-z]+)\s*", value.lower())
+    if not match or match.group(2) not in _PT_PER_UNIT:
+        raise ValueError(f"unsupported CSS length: {value}")
+    return float(match.group(1)) * _PT_PER_UNIT[match.group(2)]
+
+# User stylesheet for plutoprint. Its @page rule wins over the one in the HTML (written
+# for the first page size only). Wide tables are clipped like Chromium's scrolling output
+# boxes; otherwise they widen the document and plutoprint shrinks every page to fit it.
+_PLUTOPRINT_STYLE = string.Template("""
+@page { size: ${width}mm ${height}mm; margin: $margins; }
+.container, #notebook-container { width: auto !important; max-width: none !important; }
+.rendered_html table, .dataframe { display: block; max-width: 100%; overflow: hidden; }
+""")
+
+def _render_with_plutoprint(spec):
+    """Print a spec with plutoprint; returns False so the caller can fall back to Chromium."""
+    try:
+        for target in spec.targets:
+            page = target.page
+            margin = _css_length_to_pt(page.margins)
+            book = plutoprint.Book(
+                plutoprint.PageSize(page.width_mm * plutoprint.UNITS_MM, page.height_mm * plutoprint.UNITS_MM),
+                plutoprint.PageMargins(margin, margin, margin, margin),
+                plutoprint.MEDIA_TYPE_PRINT,
+            )
+            user_style = _PLUTOPRINT_STYLE.substitute(
+                width=page.width_mm, height=page.height_mm, margins=page.margins
+            )
+            book.load_html(spec.html, user_style=user_style, base_url=spec.base_url)
+            book.write_to_pdf(target.output_file)
+            
+            file_size = Path(target.output_file).stat().st_size / (1024 * 1024)
+            logger.info(f"✅ Created: {target.output_file} ({file_size:.1f} MB, plutoprint)")
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️  plutoprint rendering failed ({e}); falling back to Chromium")
+        return False
+
+def _remote_request_router(blocked_types):
+    """Route handler aborting remote requests whose resource type is in blocked_types."""
+    async def route_remote_request(route):
+        if route.request.resource_type in blocked_types:
+            await route.abort()
+        else:
+            await route.continue_()
+    return route_remote_request
+
+# Replace the page geometry <style> and redraw JS-rendered Plotly charts at the new width
+_APPLY_PAGE_GEOMETRY_JS = """([id, css]) => {
+    document.getElementById(id).textContent = css;
+    const charts = window.Plotly ? [...document.querySelectorAll('.js-plotly-plot')] : [];
+    return Promise.all(charts.map(gd => Plotly.Plots.resize(gd)));
+}"""
+
+def _viewport_for(page):
+    """Viewport matching a page's size in CSS pixels."""
+    return {"width": int(page.width_mm * _PX_PER_MM), "height": int(page.height_mm * _PX_PER_MM)}
+
+async def _apply_page_geometry(page, spec_page):
+    """Re-lay the loaded document out for another PageSpec before printing it.
+
+    Without this, Chromium would scale the first page's layout to fit the new paper.
+    """
+    await page.set_viewport_size(_viewport_for(spec_page))
+    css = _page_geometry_css(spec_page.width_mm, spec_page.height_mm, spec_page.margins)
+    await page.evaluate(_APPLY_PAGE_GEOMETRY_JS, [_PAGE_STYLE_ID, css])
+
+async def _print_pdf_streamed(cdp, target, margin_in):
+    """Print the page with CDP Page.printToPDF, streaming the PDF to disk chunk by chunk.
+
+    page.pdf(path=...) holds the whole document in memory (as base64, then bytes)
+    before writing it; in stream mode only one chunk is in flight at a time.
+    """
+    result = await cdp.send("Page.printToPDF", {
+        "paperWidth": target.page.width_mm / 25.4,
+        "paperHeight": target.page.height_mm / 25.4,
+        "marginTop": margin_in,
+        "marginRight": margin_in,
+        "marginBottom": margin_in,
+        "marginLeft": margin_in,
+        "printBackground": True,
+        # Skip the accessibility structure tree; it can dwarf the page content
+        "generateTaggedPDF": False,
+        "transferMode": "ReturnAsStream",
+    })
+    handle = result["stream"]
+    try:
+        with open(target.output_file, 'wb') as f:
+            while True:
+                chunk = await cdp.send("IO.read", {"handle": handle, "size": _PDF_STREAM_CHUNK})
+                data = chunk["data"]
+                f.write(base64.b64decode(data) if chunk.get("base64Encoded") else data.encode('latin-1'))
+                if chunk.get("eof"):
+                    break
+    finally:
+        await cdp.send("IO.close", {"handle": handle})
+
+async def _render_pdf(browser, spec):
+    """Print a single spec to its PDF target(s) in its own browser context.
+
+    The page is loaded once; a target with another page geometry re-lays it out first.
+    """
+    context = None
+    try:
+        # Size the viewport to the page up front so Chromium doesn't re-layout on navigation
+        context = await browser.new_context(
+            viewport=_viewport_for(spec.targets[0].page),
+            device_scale_factor=1,
+        )
+        # Web fonts, media and sockets on CDNs would only hold up the load/networkidle waits
+        blocked_types = _BLOCKED_RESOURCE_TYPES_MATH if spec.has_math else _BLOCKED_RESOURCE_TYPES
+        await context.route(_REMOTE_URL_RE, _remote_request_router(blocked_types))
+        page = await context.new_page()
+
+        # Feed the HTML straight to the page instead of round-tripping it through a temp
+        # file. set_content() keeps the current document's URL, so navigate to the
+        # notebook's directory first: file:// assets (relative images in markdown) are
+        # only loadable from a file:// origin and resolve against it.
+        await page.goto(spec.base_url, wait_until="domcontentloaded")
+
+        # Lay the document out with print rules from the start rather than re-laying
+        # it out for print when page.pdf() runs.
+        await page.emulate_media(media="print")
+
+        # The HTML is static with inlined CSS, so DOMContentLoaded is enough here;
+        # remaining sub-resources are covered by the bounded networkidle wait below.
+        # Multi-MB notebooks can take longer than Playwright's default 30s to parse.
+        await page.set_content(spec.html, wait_until="domcontentloaded", timeout=60000)
+
+        # Only scripts (Plotly, MathJax) need the network to go quiet; a static page just
+        # has to finish loading its images. Both waits are bounded so blocked CDNs can't hang us.
+        try:
+            if spec.plotly_count > 0 or spec.has_math:
+                await page.wait_for_load_state("networkidle", timeout=5000)
             else:
-                output_file = output_file + '.pdf'
+                await page.wait_for_load_state("load", timeout=5000)
+        except Exception:
+            pass
 
-            print("🎭 Converting HTML to PDF with Playwright...")
+        if spec.plotly_count > 0:
+            logger.info(f"⏳ Waiting for {spec.plotly_count} Plotly chart(s) to render...")
+            try:
+                await page.wait_for_function("typeof Plotly !== 'undefined'", timeout=60000)
+                await page.wait_for_function("window.plotlyRenderingComplete === true", timeout=180000)
+                await page.wait_for_timeout(500)
+                logger.info(f"✓ All {spec.plotly_count} Plotly charts rendered")
+            except Exception as e:
+                logger.warning(f"⚠️  Plotly rendering timeout: {e}")
+                logger.warning("    Continuing anyway - some charts may be missing")
+        else:
+            logger.info("ℹ️  No Plotly charts found in this notebook")
 
-            with sync_playwright() as p:
-                browser = None
-                page = None
-                try:
-                    browser = p.chromium.launch()
-                    page = browser.new_page()
+        if spec.has_math:
+            logger.info("ℹ️  Math detected; relying on notebook/nbconvert rendering (no MathJax)")
 
-                    # Avoid networkidle hangs when CDNs are blocked; rely on local assets where possible.
-                    page.goto(f"file://{html_file}", wait_until="load")
-                    try:
-                        page.wait_for_load_state("networkidle", timeout=5000)
-                    except Exception:
-                        pass
+        cdp = await context.new_cdp_session(page)
+        laid_out_for = spec.targets[0].page
+        for target in spec.targets:
+            if target.page != laid_out_for:
+                await _apply_page_geometry(page, target.page)
+                laid_out_for = target.page
+            try:
+                margin_in = _css_length_to_pt(target.page.margins) / 72
+            except ValueError:
+                margin_in = None
+            
+            if margin_in is not None:
+                await _print_pdf_streamed(cdp, target, margin_in)
+            else:
+                # A margin value CDP can't take as a single length; let Playwright parse it
+                await page.pdf(
+                    path=target.output_file,
+                    format=None,
+                    width=f"{target.page.width_mm}mm",
+                    height=f"{target.page.height_mm}mm",
+                    margin={
+                        "top": target.page.margins,
+                        "right": target.page.margins,
+                        "bottom": target.page.margins,
+                        "left": target.page.margins,
+                    },
+                    print_background=True,
+                    # Skip the accessibility structure tree; it can dwarf the page content
+                    tagged=False,
+                )
 
-                    if len(plotly_charts) > 0:
-                        print(f"⏳ Waiting for {len(plotly_charts)} Plotly chart(s) to render...")
-                        try:
-                            page.wait_for_function("typeof Plotly !== 'undefined'", timeout=60000)
-                            page.wait_for_function("window.plotlyRenderingComplete === true", timeout=180000)
-                            page.wait_for_timeout(500)
-                            print(f"✓ All {len(plotly_charts)} Plotly charts rendered")
-                        except Exception as e:
-                            print(f"⚠️  Plotly rendering timeout: {e}")
-                            print("    Continuing anyway - some charts may be missing")
-                    else:
-                        print("ℹ️  No Plotly charts found in this notebook")
-
-                    if has_math:
-                        print("ℹ️  Math detected; relying on notebook/nbconvert rendering (no MathJax)")
-
-                    page.wait_for_timeout(500)
-                    page.pdf(
-                        path=output_file,
-                        format=None,
-                        width=f"{width}mm",
-                        height=f"{height}mm",
-                        margin={
-                            "top": margins,
-                            "right": margins,
-                            "bottom": margins,
-                            "left": margins,
-                        },
-                        print_background=True,
-                    )
-
-                finally:
+            file_size = Path(target.output_file).stat().st_size / (1024 * 1024)
+            logger.info(f"✅ Created: {target.output_file} ({file_size:.1f} MB, untagged)")
+        return True
+
+    except Exception as e:
+        logger.error(f"❌ Playwright conversion failed for {spec.targets[0].output_file}: {e}")
+        return False
+    finally:
+        try:
+            if context is not None:
+                await context.close()
+        except Exception:
+            pass
+
+def convert_batch_with_playwright(notebook_files, pages, output_file=None, **kwargs):
+    """Convert several notebooks with Playwright, launching Chromium only once.
+
+    Each notebook is converted to HTML once and printed to every PageSpec in ``pages``.
+    """
+    
+    try:
+        from playwright.async_api import async_playwright  # noqa: F401 - fail fast if missing
+        
+        for page in pages:
+            logger.info(f"📄 Playwright: {page.describe()}")
+
+        success = True
+        notebook_files = list(notebook_files)
+        # Build and print a browser's worth of notebooks at a time, so only that many
+        # HTML documents (each possibly carrying inlined plotly.js) are held at once
+        for start in range(0, len(notebook_files), _MAX_CONCURRENT_PAGES):
+            specs = []
+            try:
+                for notebook_file in notebook_files[start:start + _MAX_CONCURRENT_PAGES]:
                     try:
-                        if page is not None:
-                            page.close()
-                    except Exception:
-                        pass
+                        specs.append(_build_playwright_spec(
+                            notebook_file, pages, output_file, **kwargs
+                        ))
+                    except Exception as e:
+                        logger.error(f"❌ Playwright conversion failed for {notebook_file}: {e}")
+                        success = False
+
+                if specs:
+                    logger.info("🎭 Converting HTML to PDF with Playwright...")
+                    success = all(_render_pdfs(specs)) and success
+
+            finally:
+                for spec in specs:
                     try:
-                        if browser is not None:
-                            browser.close()
+                        if spec.debug_html:
+                            os.unlink(spec.debug_html)
                     except Exception:
                         pass
-
-            file_size = os.path.getsize(output_file) / (1024 * 1024)
-            print(f"✅ Created: {output_file} ({file_size:.1f} MB)")
-            return True
-
-        finally:
-            try:
-                os.unlink(html_file)
-            except Exception:
-                pass
-            try:
-                if debug_html:
-                    os.unlink(debug_html)
-            except Exception:
-                pass
+        return success
                 
     except ImportError:
-        print("❌ Playwright not available. Install with: pip install playwright")
+        logger.error("❌ Playwright not available. Install with: pip install playwright")
         return False
     except Exception as e:
-        print(f"❌ Playwright conversion failed: {e}")
+        logger.error(f"❌ Playwright conversion failed: {e}")
         return False
 
+def convert_with_playwright_direct(notebook_file, page, output_file=None, **kwargs):
+    """Alternative method using Playwright directly for better page size control."""
+    return convert_batch_with_playwright([notebook_file], [page], output_file, **kwargs)
+
+
+class _ConsoleSafeFilter(logging.Filter):
+    """Drop characters (mostly emoji) that the console encoding can't represent."""
+    
+    def __init__(self, encoding):
+        super().__init__()
+        self.encoding = encoding
+    
+    def filter(self, record):
+        record.msg = record.getMessage().encode(self.encoding, 'ignore').decode(self.encoding)
+        record.args = None
+        return True
+
+def configure_logging(level=logging.INFO):
+    """Send status messages to stdout as plain lines, as the CLI always has."""
+    handler = logging.StreamHandler(sys.stdout)
+    encoding = sys.stdout.encoding or 'ascii'
+    if not encoding.lower().replace('-', '').startswith('utf'):
+        handler.addFilter(_ConsoleSafeFilter(encoding))
+    logging.basicConfig(level=level, format='%(message)s', handlers=[handler], force=True)
+
+def _convert_one(convert, notebook_files, convert_args, convert_kwargs):
+    """Worker-process entry point: run one converter on its share of the notebooks."""
+    return convert(notebook_files, *convert_args, **convert_kwargs)
+
+def _parse_size_list(value):
+    """argparse type for --sizes: validate a comma-separated list of page size presets."""
+    sizes = [size.strip().lower() for size in value.split(',') if size.strip()]
+    unknown = [size for size in sizes if size not in _NORMALIZED_SIZES]
+    if not sizes or unknown:
+        raise argparse.ArgumentTypeError(
+            f"invalid size list {value!r} (choose from {', '.join(PAGE_SIZES)})"
+        )
+    return sizes
+
 def main():
     parser = argparse.ArgumentParser(
         description="Convert a Jupyter notebook (.ipynb) into a PDF with a chosen paper size (uses Playwright by default).",
@@ -633,7 +1450,7 @@ def main():
         epilog="""
 Methods:
   playwright - Recommended: HTML -> PDF via Playwright (good CSS + reliable Plotly rendering)
-  template   - Legacy: nbconvert WebPDF template-based pipeline
+  template   - Legacy: custom nbconvert lab template, printed with Playwright
   both       - Run both methods to compare output
 
 Notes:
@@ -644,12 +1461,17 @@ Examples:
   python jamboree_converter.py notebook.ipynb --size a3
   python jamboree_converter.py notebook.ipynb --size a2 --orientation landscape
   python jamboree_converter.py notebook.ipynb --size case_study --no-code --no-prompts
+  python jamboree_converter.py first.ipynb second.ipynb --size a3
+  python jamboree_converter.py notebook.ipynb --sizes a4,a3,letter
         """
     )
     
-    parser.add_argument('notebook', nargs='?', help='Input notebook file (.ipynb)')
+    parser.add_argument('notebooks', nargs='*', metavar='notebook',
+                       help='Input notebook file(s) (.ipynb). Several notebooks are converted in parallel (see --jobs)')
     parser.add_argument('--size', '-s', choices=list(PAGE_SIZES.keys()), 
                        default='a4', help='Page size preset (default: a4)')
+    parser.add_argument('--sizes', type=_parse_size_list, metavar='SIZE[,SIZE...]',
+                       help='Comma-separated page sizes to produce from a single render (overrides --size)')
     parser.add_argument('--orientation', choices=['portrait', 'landscape'], 
                        default='portrait', help='Page orientation (default: portrait)')
     parser.add_argument('--method', choices=['template', 'playwright', 'both'], 
@@ -658,9 +1480,12 @@ Examples:
     parser.add_argument('--margins', default='20mm', help='Page margins CSS value (default: 20mm)')
     parser.add_argument('--no-code', action='store_true', help='Hide code cells (input). Useful for report-style PDFs')
     parser.add_argument('--no-prompts', action='store_true', help='Hide input/output prompts (In [1], Out [1])')
+    parser.add_argument('--jobs', '-j', type=int,
+                       help='Worker processes for converting several notebooks (default: CPU count)')
     parser.add_argument('--list-sizes', action='store_true', help='List available page sizes and exit')
     
     args = parser.parse_args()
+    configure_logging()
     
     if args.list_sizes:
         print("\n📐 Available page sizes:")
@@ -671,48 +1496,109 @@ Examples:
         print("🎨 Methods: template, playwright (recommended), both")
         return
     
-    if not args.notebook:
+    if not args.notebooks:
         parser.error("notebook argument is required (unless using --list-sizes)")
     
-    if not os.path.exists(args.notebook):
-        print(f"❌ File not found: {args.notebook}")
-        sys.exit(1)
+    if args.output and len(args.notebooks) > 1:
+        parser.error("--output can only be used with a single notebook")
     
-    print(f"\n📄 Converting: {args.notebook}")
-    print(f"📐 Page size: {args.size.upper()} {args.orientation}")
-    print(f"🎨 Method: {args.method}")
+    # Outputs are named after the notebook's stem in the current directory, so
+    # a/report.ipynb and b/report.ipynb would overwrite each other's PDFs
+    stems = [Path(notebook).stem for notebook in args.notebooks]
+    duplicates = sorted({stem for stem in stems if stems.count(stem) > 1})
+    if duplicates:
+        parser.error(f"notebooks with the same name would overwrite each other's output: {', '.join(duplicates)}")
     
-    success = True
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
     
-    # Convert using selected method(s)
-    if args.method in ['template', 'both']:
-        print("\n" + "="*50)
-        print("📄 Template Method (Custom CSS)")
-        print("="*50)
-        result = convert_with_working_pagesize(
-            args.notebook, args.size, args.orientation,
-            args.margins, args.output,
-            no_input=args.no_code, no_prompt=args.no_prompts
-        )
-        success = success and result
+    for notebook in args.notebooks:
+        if not os.path.exists(notebook):
+            logger.error(f"❌ File not found: {notebook}")
+            sys.exit(1)
+    
+    logger.info(f"\n📄 Converting: {', '.join(args.notebooks)}")
+    sizes = args.sizes or [args.size]
+    logger.info(f"📐 Page size: {', '.join(size.upper() for size in sizes)} {args.orientation}")
+    logger.info(f"🎨 Method: {args.method}")
+    
+    # Check for (and if needed download) Chromium while the notebooks are converted to HTML
+    prewarm_chromium()
     
+    pages = [PageSpec.from_args(size, args.orientation, args.margins) for size in sizes]
+    convert_kwargs = dict(no_input=args.no_code, no_prompt=args.no_prompts)
+    
+    # Collect selected method(s); with --method both, --output gets a per-method
+    # suffix so the two (possibly concurrent) conversions don't write the same file
+    methods = []
+    if args.method in ['template', 'both']:
+        methods.append(("📄 Template Method (Custom CSS)", convert_batch_with_template, '_sized'))
     if args.method in ['playwright', 'both']:
-        print("\n" + "="*50)
-        print("🎭 Playwright Method (Direct Control)")
-        print("="*50)
-        result = convert_with_playwright_direct(
-            args.notebook, args.size, args.orientation,
-            args.margins, args.output,
-            no_input=args.no_code, no_prompt=args.no_prompts
-        )
-        success = success and result
+        methods.append(("🎭 Playwright Method (Direct Control)", convert_batch_with_playwright, '_playwright'))
+    methods = [
+        (title, convert, (pages, args.output + suffix if args.output and len(methods) > 1 else args.output))
+        for title, convert, suffix in methods
+    ]
+    
+    # With several workers, every notebook becomes its own task; otherwise each
+    # method converts the whole batch from one browser.
+    # By default use every core, but always let --method both run its two methods side by side
+    jobs = args.jobs or max(os.cpu_count() or 1, len(methods))
+    if jobs > 1:
+        tasks = [
+            (title, convert, convert_args, [notebook])
+            for title, convert, convert_args in methods for notebook in args.notebooks
+        ]
+    else:
+        tasks = [(title, convert, convert_args, args.notebooks) for title, convert, convert_args in methods]
+    workers = min(jobs, len(tasks))
+    
+    if workers == 1:
+        success = True
+        for title, convert, convert_args, notebooks in tasks:
+            logger.info("\n" + "="*50)
+            logger.info(title)
+            logger.info("="*50)
+            success = convert(notebooks, *convert_args, **convert_kwargs) and success
+    else:
+        # The tasks are independent and each worker drives its own Chromium, so run
+        # them side by side in separate processes rather than one after the other.
+        logger.info("\n" + "="*50)
+        logger.info(" + ".join(title for title, _, _ in methods) + f" (in parallel, {workers} workers)")
+        logger.info("="*50)
+        # Worker processes can't see the prewarm thread, so let it finish before forking
+        wait_for_chromium()
+        with ProcessPoolExecutor(max_workers=workers, initializer=configure_logging) as executor:
+            futures = {
+                executor.submit(_convert_one, convert, notebooks, convert_args, convert_kwargs): i
+                for i, (_, convert, convert_args, notebooks) in enumerate(tasks)
+            }
+            results = [False] * len(tasks)
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                try:
+                    results[i] = bool(future.result())
+                except Exception as e:
+                    logger.error(f"❌ Conversion worker failed: {e}")
+                status = "✓" if results[i] else "❌"
+                logger.info(f"{status} [{done}/{len(futures)}] {', '.join(tasks[i][3])}")
+        
+        # Workers log in whatever order they run; summarize per method once they are all done
+        for title, _, _ in methods:
+            logger.info("\n" + "="*50)
+            logger.info(title)
+            logger.info("="*50)
+            for (task_title, _, _, notebooks), result in zip(tasks, results):
+                if task_title == title:
+                    logger.info(f"{'✅' if result else '❌'} {', '.join(notebooks)}")
+        success = all(results)
     
     if success:
-        print(f"\n✅ Conversion completed successfully!")
+        logger.info(f"\n✅ Conversion completed successfully!")
         if args.method == 'both':
-            print("🔍 Compare both files - they should now have different page sizes!")
+            logger.info("🔍 Compare both files - they should now have different page sizes!")
     else:
-        print(f"\n❌ Conversion failed")
+        logger.error(f"\n❌ Conversion failed")
     
     sys.exit(0 if success else 1)
 
@@ -0,0 +1,102 @@
+"""Parity between the fast report-style HTML path and nbconvert's classic export."""
+
+import json
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+
+import nbformat.v4 as v4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import jamboree_converter as jc  # noqa: E402
+
+# 1x1 transparent PNG
+PNG = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+
+
+class _BodyText(HTMLParser):
+    """Collect visible body text and image sources, ignoring scripts and styles."""
+
+    def __init__(self):
+        super().__init__()
+        self.text = []
+        self.images = []
+        self._in_body = False
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'body':
+            self._in_body = True
+        elif tag in ('script', 'style'):
+            self._skip += 1
+        elif tag == 'img':
+            self.images.append(dict(attrs).get('src'))
+
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style'):
+            self._skip -= 1
+
+    def handle_data(self, data):
+        if self._in_body and not self._skip:
+            self.text.append(data)
+
+
+def _summarize(html):
+    parser = _BodyText()
+    parser.feed(html)
+    # Whitespace between elements differs, so compare without it; nbconvert also
+    # adds a pilcrow anchor link to every heading
+    text = ''.join(''.join(parser.text).replace('¶', '').split())
+    return text, parser.images
+
+
+def _fixture_notebook():
+    error = v4.new_output(
+        'error', ename='ValueError', evalue='bad value',
+        traceback=['\x1b[31mValueError\x1b[0m: bad value'],
+    )
+    nb = v4.new_notebook(cells=[
+        v4.new_markdown_cell("# Report\n\nSome **bold** text and a list:\n\n- one\n- two\n\n| a | b |\n|---|---|\n| 1 | 2 |"),
+        v4.new_raw_cell('<p class="raw-html">raw html cell</p>', metadata={'raw_mimetype': 'text/html'}),
+        v4.new_raw_cell('<p class="raw-plain">unmarked raw cell</p>'),
+        v4.new_raw_cell('\\section{latex only}', metadata={'raw_mimetype': 'text/latex'}),
+        v4.new_code_cell('print("hi")', outputs=[
+            v4.new_output('stream', name='stdout', text='hello stdout\n'),
+            v4.new_output('stream', name='stderr', text='careful stderr\n'),
+        ]),
+        v4.new_code_cell('1 / 0', outputs=[error]),
+        v4.new_code_cell('show()', outputs=[
+            v4.new_output('display_data', data={'image/png': PNG, 'text/plain': '<Figure>'}),
+        ]),
+        v4.new_code_cell('df', execution_count=3, outputs=[
+            v4.new_output('execute_result', execution_count=3,
+                          data={'text/html': '<table class="dataframe"><tr><td>cell</td></tr></table>',
+                                'text/plain': 'plain fallback'}),
+        ]),
+        v4.new_code_cell('x', execution_count=4, outputs=[
+            v4.new_output('execute_result', execution_count=4, data={'text/plain': "'just text'"}),
+        ]),
+    ])
+    # Plain JSON types, as the converter sees the notebook after _load_notebook_json
+    return json.loads(json.dumps(nb))
+
+
+def test_fixture_takes_the_fast_path():
+    assert jc._can_render_fast(_fixture_notebook())
+
+
+def test_fast_html_matches_nbconvert():
+    notebook = _fixture_notebook()
+    fast = jc._render_html_fast(notebook, '', 'fixture')
+    exporter = jc._get_html_exporter(no_input=True, no_prompt=True)
+    slow, _ = exporter.from_notebook_node(
+        jc._notebook_node_from_dict(notebook), resources={'jamboree_head': ''}
+    )
+
+    fast_text, fast_images = _summarize(fast)
+    slow_text, slow_images = _summarize(slow)
+    assert fast_text == slow_text
+    assert fast_images == slow_images
+    for marker in ('raw html cell', 'unmarked raw cell'):
+        assert marker in fast and marker in slow
+    assert 'latex only' not in fast and 'latex only' not in slow